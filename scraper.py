@@ -5,19 +5,35 @@ Scrapes voting records from the Ottawa City Council eScribe system
 and stores divided vote records in Airtable.
 """
 
+import asyncio
+import hashlib
+import json
 import logging
 import os
 import random
 import re
 import sys
+import threading
 import time
+from collections import deque
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
 from datetime import datetime, timedelta
-from typing import Any, Dict, List
+from functools import lru_cache
+from itertools import chain
+from typing import Any, Dict, List, Tuple
 
 import httpx
-from bs4 import BeautifulSoup
+import orjson
 from dateutil import parser as date_parser, tz as date_tz
+from selectolax.lexbor import LexborHTMLParser
 from pyairtable import Api
+from tenacity import (
+    RetryError,
+    Retrying,
+    retry_if_exception,
+    stop_after_attempt,
+    wait_exponential_jitter,
+)
 
 # === CONFIGURATION ===
 AIRTABLE_TOKEN = os.environ.get("AIRTABLE_TOKEN")
@@ -31,114 +47,320 @@ COUNCILLORS_TABLE = "Councillors"
 ROLLING_WINDOW_DAYS = 14
 PREFERRED_TZ = "America/Toronto"
 VERIFY_SSL = False  # eScribe’s certificate is invalid
-
-councillor_cache: Dict[str, str] = {}
+FETCH_CONCURRENCY = 6  # polite cap on simultaneous eScribe requests
+UPLOAD_CONCURRENCY = 4  # meetings uploaded in parallel, under the QPS throttle
+CACHE_DIR = "data/cache"  # published minutes never change, so cache them forever
+COUNCILLOR_CACHE_FILE = "data/councillor_cache.json"
+
+# Maps normalized last name -> Airtable record ID. Deliberately unbounded:
+# membership tracks the ~24 sitting councillors, and the mapping must survive
+# as a plain dict so it can round-trip through COUNCILLOR_CACHE_FILE.
+# A None value is a negative entry: creation failed this run, don't retry.
+councillor_cache: Dict[str, str | None] = {}
+_councillors_loaded = False  # cache seeded, from disk or from Airtable
+_councillors_fetched = False  # the table was actually read this process
+
+meeting_cache: Dict[str, dict] = {}
+_meeting_cache_table = None
 
 logging.basicConfig(level=logging.INFO, format="%(levelname)s: %(message)s")
 logger = logging.getLogger(__name__)
 
 
 # === HTTP HELPERS ===
-def safe_request(method, url, json=None, max_retries=3, timeout=30):
+async def safe_request(
+    client, method, url, json=None, max_retries=3, timeout=30, stream_to=None
+):
+    """Issue a request with retries; stream_to writes the body to a file path
+    in chunks instead of buffering the whole response in memory."""
     for i in range(max_retries):
         try:
-            r = httpx.request(
-                method, url, json=json, timeout=timeout, verify=VERIFY_SSL
-            )
-            r.raise_for_status()
-            return r
+            if stream_to is None:
+                r = await client.request(method, url, json=json, timeout=timeout)
+                r.raise_for_status()
+                return r
+            async with client.stream(method, url, timeout=timeout) as r:
+                r.raise_for_status()
+                with open(stream_to, "wb") as f:
+                    async for chunk in r.aiter_bytes(65536):
+                        f.write(chunk)
+                return r
         except Exception as e:
             logger.warning(
                 "%s %s failed (%d/%d): %s", method.upper(), url, i + 1, max_retries, e
             )
-            time.sleep(2)
+            delay = None
+            if isinstance(e, httpx.HTTPStatusError) and e.response.status_code in (
+                429,
+                503,
+            ):
+                retry_after = e.response.headers.get("Retry-After")
+                if retry_after and retry_after.isdigit():
+                    delay = int(retry_after)
+            if delay is None:
+                delay = min(60, 2**i) + random.uniform(0, 1)
+            await asyncio.sleep(delay)
     logger.error("%s %s failed after retries.", method.upper(), url)
     return None
 
 
-def get_meetings(start, end):
+async def get_meetings(client, start, end):
     """Fetch meetings from the Ottawa eScribe calendar API."""
     payload = {
         "calendarStartDate": f"{start}T00:00:00-04:00",
         "calendarEndDate": f"{end}T00:00:00-04:00",
     }
-    r = safe_request(
-        "post", f"{BASE_URL}MeetingsCalendarView.aspx/GetCalendarMeetings", json=payload
+    r = await safe_request(
+        client,
+        "post",
+        f"{BASE_URL}MeetingsCalendarView.aspx/GetCalendarMeetings",
+        json=payload,
     )
     if not r:
         return []
     try:
-        data = r.json()
+        data = orjson.loads(r.content)
         return (data.get("d") if isinstance(data, dict) else data) or []
     except Exception as e:
         logger.warning("Invalid JSON from eScribe API: %s", e)
         return []
 
 
+async def fetch_minutes(client, sem, meeting, url):
+    """Download one minutes page, bounded by the shared semaphore.
+
+    Pages are cached on disk by URL hash; repeat runs over the rolling
+    window read from the cache instead of re-fetching.
+    """
+    cache_path = os.path.join(
+        CACHE_DIR, hashlib.sha1(url.encode()).hexdigest() + ".html"
+    )
+    if os.path.exists(cache_path):
+        with open(cache_path, "rb") as f:
+            return meeting, f.read()
+
+    os.makedirs(CACHE_DIR, exist_ok=True)
+    tmp_path = cache_path + ".tmp"
+    async with sem:
+        r = await safe_request(client, "get", url, stream_to=tmp_path)
+    if not r:
+        return meeting, None
+
+    os.replace(tmp_path, cache_path)
+    with open(cache_path, "rb") as f:
+        return meeting, f.read()
+
+
 # === PARSING ===
-def parse_votes(html: str) -> List[Dict[str, Any]]:
+_NAME_SPLIT_RE = re.compile(r"\s*[;,]\s*(?:and\s+)?|\s+and\s+", re.I)
+_LEADING_AND_RE = re.compile(r"^and\s+", re.I)
+_WS_RE = re.compile(r"\s+")
+
+
+def parse_votes(html: str | bytes) -> List[Dict[str, Any]]:
     """Extract motions and votes from a meeting minutes HTML."""
-    soup = BeautifulSoup(html, "html.parser")
+    # Most meetings have no divided votes at all; a C-level substring scan
+    # is orders of magnitude cheaper than building the DOM to find that out.
+    needle = b"MotionVoters" if isinstance(html, bytes) else "MotionVoters"
+    if needle not in html:
+        return []
+
+    tree = LexborHTMLParser(html)
     motions = []
-    for item in soup.select(".AgendaItemContainer"):
-        title = item.select_one(".AgendaItemTitle a")
-        result = item.select_one(".MotionResult")
-        table = item.select_one("table.MotionVoters")
-        if not table:
+    seen_titles = set()
+    # Only a minority of agenda items record a divided vote; start from the
+    # voter tables and walk up to their containers instead of inspecting
+    # every .AgendaItemContainer on the page.
+    for table in tree.css("table.MotionVoters"):
+        item = table.parent
+        while item is not None:
+            cls = item.attributes.get("class") if item.attributes else None
+            if cls and "AgendaItemContainer" in cls:
+                break
+            item = item.parent
+        if item is None:
             continue
 
-        for_names, against_names = [], []
-        for row in table.select("tr"):
-            label, names_el = row.select_one(".VoterVote"), row.select_one(
-                ".VotesUsers"
-            )
-            if not label or not names_el:
-                continue
+        # Procedural reposts repeat the same motion; check the cheap title
+        # before doing the expensive voter-table walk.
+        title_el = item.css_first(".AgendaItemTitle a")
+        title = title_el.text().strip() if title_el else None
+        if title is not None and title in seen_titles:
+            continue
+        motion = parse_motion_item(item, table, title)
+        if motion:
+            if title is not None:
+                seen_titles.add(title)
+            motions.append(motion)
+    return deduplicate_motions(motions)
+
+
+def deduplicate_motions(motions: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+    """Drop duplicate motions by (title, result), preserving order.
+
+    Dict insertion order makes the build-and-take-values form equivalent to
+    a seen-set loop with less Python-level work. Untitled motions get a
+    unique key so two distinct ones are never collapsed.
+    """
+    return list(
+        {(m["title"] or id(m), m["result"]): m for m in motions}.values()
+    )
 
-            names = re.sub(
-                r"\band\b", ",", names_el.get_text(" ", strip=True), flags=re.I
-            )
-            names = [
-                re.sub(r"\s+", " ", n.strip(" ,")).strip()
-                for n in re.split(r"[;,]", names)
-                if n.strip()
-            ]
-
-            if "for" in label.text.lower():
-                for_names += names
-            elif "against" in label.text.lower():
-                against_names += names
-
-        if for_names or against_names:
-            motions.append(
-                {
-                    "title": title.text.strip() if title else None,
-                    "result": result.text.strip() if result else None,
-                    "for_names": for_names,
-                    "against_names": against_names,
-                }
-            )
-    return motions
+
+def parse_motion_item(item, table, title: str | None) -> Dict[str, Any] | None:
+    """Extract one motion (result, voter lists) from an agenda item node."""
+    for_names, against_names = parse_voters_table(table)
+    if not (for_names or against_names):
+        return None
+
+    result = item.css_first(".MotionResult")
+    return {
+        "title": title,
+        "result": result.text().strip() if result else None,
+        "for_names": for_names,
+        "against_names": against_names,
+    }
+
+
+def parse_voters_table(table) -> Tuple[List[str], List[str]]:
+    """Split a MotionVoters table into (for, against) name lists."""
+    for_names, against_names = [], []
+    for row in table.css("tr"):
+        label = row.css_first(".VoterVote")
+        names_el = row.css_first(".VotesUsers")
+        if not label or not names_el:
+            continue
+
+        lbl = label.text().lower()
+        is_for = "for" in lbl
+        if not is_for and "against" not in lbl:
+            continue
+
+        # A cell can open with "and " (e.g. a mangled "and A. Smith, B.
+        # Jones"); the split regex only eats "and" between tokens, so strip
+        # it per token too.
+        names = []
+        for n in _NAME_SPLIT_RE.split(names_el.text(separator=" ", strip=True)):
+            n = _LEADING_AND_RE.sub("", n.strip(" ,\u00a0"))
+            if n:
+                names.append(_WS_RE.sub(" ", n))
+
+        if is_for:
+            for_names += names
+        else:
+            against_names += names
+
+    return for_names, against_names
 
 
 # === AIRTABLE HELPERS ===
+_tables = None
+_tables_key = None
+
+
+def get_airtable_tables():
+    """Return shared table handles, building them once per configuration.
+
+    A single Api instance keeps one underlying HTTP session alive across
+    every meeting's uploads. Keyed on the Api class itself so tests that
+    monkeypatch scraper.Api get fresh fakes.
+    """
+    global _tables, _tables_key
+    key = (Api, AIRTABLE_TOKEN, BASE_ID)
+    if _tables is None or _tables_key != key:
+        api = Api(AIRTABLE_TOKEN)
+        _tables = (
+            api.table(BASE_ID, MEETINGS_TABLE),
+            api.table(BASE_ID, MOTIONS_TABLE),
+            api.table(BASE_ID, VOTES_TABLE),
+            api.table(BASE_ID, COUNCILLORS_TABLE),
+        )
+        _tables_key = key
+    return _tables
+
+
+_last_calls: deque = deque(maxlen=5)
+_throttle_lock = threading.Lock()
+_cache_lock = threading.Lock()
+
+
+def _throttle():
+    """Pace Airtable requests to the documented 5 req/s per-base limit."""
+    while True:
+        with _throttle_lock:
+            now = time.monotonic()
+            if len(_last_calls) < _last_calls.maxlen or now - _last_calls[0] >= 1.0:
+                _last_calls.append(now)
+                return
+            wait = 1.0 - (now - _last_calls[0])
+        time.sleep(wait)
+
+
+def _retryable(e: BaseException) -> bool:
+    """422 means the payload itself is invalid; retrying can't fix it."""
+    return "422" not in str(e)
+
+
+def _airtable_retrying(max_retries):
+    return Retrying(
+        stop=stop_after_attempt(max_retries),
+        wait=wait_exponential_jitter(initial=1, max=8),
+        retry=retry_if_exception(_retryable),
+    )
+
+
 def safe_airtable_create(table, payload, max_retries=3):
-    for i in range(max_retries):
-        try:
-            return table.create(payload)
-        except Exception as e:
-            msg = str(e)
-            if "422" in msg:
-                logger.error(
-                    "422: invalid payload → %s | %s",
-                    getattr(table, "name", "<table>"),
-                    payload,
-                )
-                break
-            time.sleep(min(2**i, 8) + random.random())
+    try:
+        for attempt in _airtable_retrying(max_retries):
+            with attempt:
+                _throttle()
+                return table.create(payload)
+    except RetryError:
+        pass
+    except Exception:
+        logger.error(
+            "422: invalid payload → %s | %s",
+            getattr(table, "name", "<table>"),
+            payload,
+        )
     return None
 
 
+def safe_airtable_batch_create(table, payloads, max_retries=3):
+    """Create records in 10-record chunks, retrying each chunk independently.
+
+    Airtable commits 10 records per request, so retrying must happen per
+    chunk: re-submitting a whole batch after a mid-batch failure would
+    duplicate every record the earlier chunks already created. On a chunk
+    that fails for good, the records created so far are returned, so callers
+    zipping against their payload list stay aligned.
+    """
+    created = []
+    for i in range(0, len(payloads), 10):
+        batch = payloads[i : i + 10]
+        try:
+            for attempt in _airtable_retrying(max_retries):
+                with attempt:
+                    _throttle()
+                    created.extend(table.batch_create(batch))
+        except RetryError:
+            logger.error(
+                "Batch create failed for %s; created %d/%d records.",
+                getattr(table, "name", "<table>"),
+                len(created),
+                len(payloads),
+            )
+            break
+        except Exception:
+            logger.error(
+                "422: invalid payload → %s | %s",
+                getattr(table, "name", "<table>"),
+                batch,
+            )
+            break
+    return created
+
+
 def clear_airtable(api: Api, force: bool = False):
     """Delete all records from all known tables in the configured base."""
     if not (AIRTABLE_TOKEN and BASE_ID):
@@ -176,17 +398,128 @@ def clear_airtable(api: Api, force: bool = False):
             logger.error("Failed to clear %s: %s", name, e)
 
 
+def load_councillor_cache():
+    """Seed councillor_cache from disk; record IDs are stable across runs."""
+    global _councillors_loaded
+    try:
+        with open(COUNCILLOR_CACHE_FILE) as f:
+            councillor_cache.update(json.load(f))
+    except (OSError, ValueError):
+        return
+    if councillor_cache:
+        _councillors_loaded = True
+
+
+def save_councillor_cache():
+    os.makedirs(os.path.dirname(COUNCILLOR_CACHE_FILE), exist_ok=True)
+    with open(COUNCILLOR_CACHE_FILE, "w") as f:
+        # Negative entries are per-run only; don't persist them.
+        json.dump({k: v for k, v in councillor_cache.items() if v}, f)
+
+
+def load_meeting_cache(t_meetings):
+    """Index all known meetings by Meeting ID in one fetch.
+
+    One download replaces a formula round-trip per meeting; re-keyed when
+    the table handle changes so tests with fresh fakes repopulate.
+    """
+    global _meeting_cache_table
+    with _cache_lock:
+        if _meeting_cache_table is t_meetings:
+            return
+        meeting_cache.clear()
+        _throttle()
+        for rec in t_meetings.all():
+            mid = rec.get("fields", {}).get("Meeting ID")
+            if mid:
+                meeting_cache[mid] = rec
+        _meeting_cache_table = t_meetings
+
+
+@lru_cache(maxsize=1024)
+def _last_name_key(name: str) -> str:
+    """Normalized last name used as the councillor cache key."""
+    return name.strip().split()[-1].lower()
+
+
+@lru_cache(maxsize=256)
+def normalize_outcome(result: str | None) -> str | None:
+    """Map an eScribe result string to Passed/Failed, or pass it through."""
+    res = (result or "").lower()
+    if any(k in res for k in ["carried", "passed", "adopted"]):
+        return "Passed"
+    if any(k in res for k in ["lost", "failed", "not carried"]):
+        return "Failed"
+    return result
+
+
+def _fetch_councillors(t_councillors):
+    """Read the Councillors table into the cache. Caller holds _cache_lock."""
+    global _councillors_loaded, _councillors_fetched
+    _throttle()
+    for rec in t_councillors.all():
+        val = rec["fields"].get("Councillor", "").strip()
+        if val:
+            councillor_cache[_last_name_key(val)] = rec["id"]
+    _councillors_loaded = True
+    _councillors_fetched = True
+
+
+def _ensure_councillors_loaded(t_councillors):
+    with _cache_lock:
+        if not _councillors_loaded:
+            _fetch_councillors(t_councillors)
+
+
+def resolve_councillors(t_councillors, names):
+    """Cache record IDs for all names at once, batch-creating the missing.
+
+    One bulk load plus one batch_create replaces a create round-trip per
+    unknown name; get_or_create_councillor then runs entirely on cache hits.
+    Serialized so concurrent meeting uploads can't double-create a name.
+    """
+    _ensure_councillors_loaded(t_councillors)
+
+    with _cache_lock:
+        missing = {}
+        for name in names:
+            if not name:
+                continue
+            last = _last_name_key(name)
+            if last not in councillor_cache and last not in missing:
+                missing[last] = name.strip()
+
+        if missing and not _councillors_fetched:
+            # The disk-seeded cache can be stale: a crashed run may have
+            # created these councillors after the cache was last written.
+            # Confirm against Airtable before creating duplicates.
+            _fetch_councillors(t_councillors)
+            missing = {
+                last: name
+                for last, name in missing.items()
+                if last not in councillor_cache
+            }
+
+        if not missing:
+            return
+        created = safe_airtable_batch_create(
+            t_councillors, [{"Councillor": n} for n in missing.values()]
+        )
+        for (last, name), rec in zip(missing.items(), created):
+            if rec:
+                councillor_cache[last] = rec["id"]
+                logger.info("Created councillor: %s", name)
+        for last in missing:
+            councillor_cache.setdefault(last, None)
+
+
 def get_or_create_councillor(t_councillors, name: str) -> str | None:
     """Ensure councillor record exists, using normalized last name as key."""
     if not name:
         return None
-    last = name.strip().split()[-1].lower()
+    last = _last_name_key(name)
 
-    if not councillor_cache:
-        for rec in t_councillors.all():
-            val = rec["fields"].get("Councillor", "").strip()
-            if val:
-                councillor_cache[val.split()[-1].lower()] = rec["id"]
+    _ensure_councillors_loaded(t_councillors)
 
     if last in councillor_cache:
         return councillor_cache[last]
@@ -196,6 +529,7 @@ def get_or_create_councillor(t_councillors, name: str) -> str | None:
         councillor_cache[last] = rec["id"]
         logger.info("Created councillor: %s", name.strip())
         return rec["id"]
+    councillor_cache[last] = None
     return None
 
 
@@ -208,16 +542,32 @@ def upload_to_airtable(meeting, motions):
         logger.info("No divided votes for %s; skipping.", meeting.get("MeetingName"))
         return
 
-    api = Api(AIRTABLE_TOKEN)
-    t_meetings = api.table(BASE_ID, MEETINGS_TABLE)
-    t_motions = api.table(BASE_ID, MOTIONS_TABLE)
-    t_votes = api.table(BASE_ID, VOTES_TABLE)
-    t_councillors = api.table(BASE_ID, COUNCILLORS_TABLE)
+    t_meetings, t_motions, t_votes, t_councillors = get_airtable_tables()
 
+    load_meeting_cache(t_meetings)
     mid = meeting.get("ID", "").replace("'", "''")
-    existing = t_meetings.all(formula=f"{{Meeting ID}}='{mid}'")
-    if existing:
-        m_rec = existing[0]
+    m_rec = meeting_cache.get(meeting.get("ID"))
+    existing_motions: Dict[str, str] = {}  # Decision -> motion record ID
+    existing_votes: set = set()  # (motion record ID, councillor record ID)
+    if m_rec:
+        # One query each for the meeting's uploaded motions and votes, so
+        # re-runs converge: existing motions are reused rather than skipped,
+        # and any votes a previous run failed to attach get backfilled.
+        _throttle()
+        for rec in t_motions.all(
+            formula=f"{{Meeting ID (from Meeting)}}='{mid}'"
+        ):
+            decision = rec.get("fields", {}).get("Decision")
+            if decision is not None:
+                existing_motions[decision] = rec["id"]
+        if existing_motions:
+            _throttle()
+            for rec in t_votes.all(
+                formula=f"{{Meeting ID (from Motion)}}='{mid}'"
+            ):
+                fields = rec.get("fields", {})
+                if fields.get("Motion") and fields.get("Councillor"):
+                    existing_votes.add((fields["Motion"][0], fields["Councillor"][0]))
     else:
         dt = date_parser.parse(meeting.get("StartDate")).astimezone(
             date_tz.gettz(PREFERRED_TZ)
@@ -231,42 +581,129 @@ def upload_to_airtable(meeting, motions):
                 "Source": f"{BASE_URL.rstrip('/')}/Meeting.aspx?Id={meeting.get('ID')}&Agenda=PostMinutes",
             },
         )
+        if m_rec:
+            meeting_cache[meeting.get("ID")] = m_rec
     if not m_rec:
         return
 
-    for motion in motions:
-        res = (motion.get("result") or "").lower()
-        if any(k in res for k in ["carried", "passed", "adopted"]):
-            outcome = "Passed"
-        elif any(k in res for k in ["lost", "failed", "not carried"]):
-            outcome = "Failed"
-        else:
-            outcome = motion.get("result")
+    resolve_councillors(
+        t_councillors,
+        {n for m in motions for n in m["for_names"] + m["against_names"]},
+    )
 
-        mot = safe_airtable_create(
-            t_motions,
+    new_motions = [m for m in motions if m["title"] not in existing_motions]
+    motion_payloads = []
+    for motion in new_motions:
+        motion_payloads.append(
             {
                 "Meeting": [m_rec["id"]],
                 "Decision": motion["title"],
-                "Outcome": outcome,
+                "Outcome": normalize_outcome(motion.get("result")),
                 "For Count": len(motion["for_names"]),
                 "Against Count": len(motion["against_names"]),
-            },
+            }
         )
+
+    motion_recs = list(
+        zip(safe_airtable_batch_create(t_motions, motion_payloads), new_motions)
+    )
+    # Motions already in Airtable may still be missing votes (e.g. a prior
+    # run died between motion and vote creation); include them for backfill.
+    motion_recs += [
+        ({"id": existing_motions[m["title"]]}, m)
+        for m in motions
+        if m["title"] in existing_motions
+    ]
+
+    vote_payloads = []
+    seen_votes: set = set()
+    for mot, motion in motion_recs:
         if not mot:
             continue
 
-        for name, vote in [(n, "Yes") for n in motion["for_names"]] + [
-            (n, "No") for n in motion["against_names"]
-        ]:
+        for name, vote in chain(
+            ((n, "Yes") for n in motion["for_names"]),
+            ((n, "No") for n in motion["against_names"]),
+        ):
             cid = get_or_create_councillor(t_councillors, name)
-            if cid:
-                safe_airtable_create(
-                    t_votes, {"Motion": [mot["id"]], "Councillor": [cid], "Vote": vote}
-                )
+            if not cid:
+                continue
+            if (mot["id"], cid) in existing_votes:
+                continue
+            key = (mot["id"], cid, vote)
+            if key in seen_votes:
+                continue
+            seen_votes.add(key)
+            vote_payloads.append(
+                {"Motion": [mot["id"]], "Councillor": [cid], "Vote": vote}
+            )
+
+    safe_airtable_batch_create(t_votes, vote_payloads)
 
 
 # === MAIN ===
+def _upload_one(meeting, motions):
+    logger.info("%s: %d motions parsed", meeting.get("MeetingName"), len(motions))
+    upload_to_airtable(meeting, motions)
+
+
+async def main(start, end):
+    """Fetch all minutes pages concurrently, then parse and upload each."""
+    load_councillor_cache()
+    sem = asyncio.Semaphore(FETCH_CONCURRENCY)
+    async with httpx.AsyncClient(
+        http2=True,
+        verify=VERIFY_SSL,
+        timeout=30,
+        limits=httpx.Limits(max_keepalive_connections=20, max_connections=20),
+        headers={"User-Agent": "OttawaVoteTracker/1.0"},
+    ) as client:
+        tasks = []
+        for m in await get_meetings(client, start, end):
+            # Each meeting has at most one English HTML minutes document;
+            # stop scanning its attachments as soon as it is found.
+            url = next(
+                (
+                    doc["Url"]
+                    for doc in m.get("MeetingDocumentLink", [])
+                    if doc.get("Type") == "PostMinutes"
+                    and doc.get("Format") == "HTML"
+                    and "English" in doc.get("Url", "")
+                ),
+                None,
+            )
+            if url:
+                tasks.append(fetch_minutes(client, sem, m, BASE_URL + url))
+        results = await asyncio.gather(*tasks, return_exceptions=True)
+
+    fetched = []
+    for res in results:
+        if isinstance(res, BaseException):
+            logger.warning("Minutes fetch failed: %s", res)
+            continue
+        meeting, html = res
+        if html is not None:
+            fetched.append((meeting, html))
+    if not fetched:
+        return
+
+    # Parsing is pure CPU and independent per page; fan it out across cores.
+    with ProcessPoolExecutor(max_workers=os.cpu_count()) as pool:
+        parsed = list(pool.map(parse_votes, (html for _, html in fetched)))
+
+    # Uploads are I/O-bound on Airtable; overlap meetings while the shared
+    # throttle keeps the combined request rate under the 5 QPS limit.
+    try:
+        with ThreadPoolExecutor(max_workers=UPLOAD_CONCURRENCY) as uploads:
+            list(
+                uploads.map(_upload_one, (meeting for meeting, _ in fetched), parsed)
+            )
+    finally:
+        # Persist even on failure so councillors created mid-run keep
+        # their record IDs for the next run.
+        save_councillor_cache()
+
+
 if __name__ == "__main__":
     import argparse
 
@@ -293,19 +730,6 @@ if __name__ == "__main__":
     end = datetime.now()
     logger.info("Scraping meetings from %s to %s", start.date(), end.date())
 
-    for m in get_meetings(start.strftime("%Y-%m-%d"), end.strftime("%Y-%m-%d")):
-        for doc in m.get("MeetingDocumentLink", []):
-            if (
-                doc.get("Type") == "PostMinutes"
-                and doc.get("Format") == "HTML"
-                and "English" in doc.get("Url", "")
-            ):
-                r = safe_request("get", BASE_URL + doc["Url"])
-                if r:
-                    motions = parse_votes(r.text)
-                    logger.info(
-                        "%s: %d motions parsed", m.get("MeetingName"), len(motions)
-                    )
-                    upload_to_airtable(m, motions)
+    asyncio.run(main(start.strftime("%Y-%m-%d"), end.strftime("%Y-%m-%d")))
 
     logger.info("Scraping completed successfully.")
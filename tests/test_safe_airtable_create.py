@@ -26,6 +26,40 @@ def test_safe_airtable_create_gives_up():
     rec = scraper.safe_airtable_create(t, {"foo": "bar"}, max_retries=3)
     assert rec is None
 
+class ChunkFlakyTable:
+    """batch_create succeeds on the first 10-record chunk, then raises."""
+
+    name = "Chunky"
+
+    def __init__(self, error):
+        self.error = error
+        self.batch_calls = []
+
+    def batch_create(self, payloads):
+        self.batch_calls.append(list(payloads))
+        if len(self.batch_calls) > 1:
+            raise self.error
+        return [{"id": f"rec_{i}"} for i in range(len(payloads))]
+
+
+def test_safe_airtable_batch_create_returns_prefix_on_chunk_failure():
+    t = ChunkFlakyTable(RuntimeError("transient error"))
+    payloads = [{"n": i} for i in range(25)]
+    recs = scraper.safe_airtable_batch_create(t, payloads, max_retries=2)
+    # chunk 1 committed; chunk 2 failed after retries; chunk 3 never sent
+    assert len(recs) == 10
+    assert len(t.batch_calls) == 3  # chunk 1 once, chunk 2 twice
+    assert t.batch_calls[1] == t.batch_calls[2] == payloads[10:20]
+
+
+def test_safe_airtable_batch_create_does_not_retry_422():
+    t = ChunkFlakyTable(RuntimeError("422 Unprocessable Entity"))
+    payloads = [{"n": i} for i in range(25)]
+    recs = scraper.safe_airtable_batch_create(t, payloads, max_retries=3)
+    assert len(recs) == 10
+    assert len(t.batch_calls) == 2  # the 422 chunk is submitted exactly once
+
+
 def test_safe_airtable_create_retries(monkeypatch):
     calls = []
     def flaky_create(payload):
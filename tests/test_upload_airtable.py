@@ -23,6 +23,9 @@ def make_tables(meetings_all):
             self.created.append(payload)
             return rec
 
+        def batch_create(self, payloads):
+            return [self.create(p) for p in payloads]
+
         def all(self, formula=None):
             return self._meetings_all
 
@@ -40,7 +43,7 @@ def test_upload_skips_existing_meeting(monkeypatch):
     motions = scraper.parse_votes(html)
 
     meetings_table, motions_table, votes_table, councillors_table = make_tables(
-        [{"id": "m_exist"}]
+        [{"id": "m_exist", "fields": {"Meeting ID": "M1"}}]
     )
 
     # New pyairtable.Api interface: Api(token).table(base, name)
@@ -78,6 +81,93 @@ def test_upload_skips_existing_meeting(monkeypatch):
     assert len(votes_table.created) == expected_votes
 
 
+def test_upload_backfills_only_missing_votes(monkeypatch):
+    html = Path("tests/fixtures/sample_minutes.html").read_text(encoding="utf-8")
+    motions = scraper.parse_votes(html)
+    title = motions[0]["title"]
+
+    class SeededTable:
+        def __init__(self, name, recs=None):
+            self.name = name
+            self.created = []
+            self._recs = recs or []
+
+        def create(self, payload):
+            rec = {"id": f"{self.name}_rec_{len(self.created)+1}"}
+            self.created.append(payload)
+            return rec
+
+        def batch_create(self, payloads):
+            return [self.create(p) for p in payloads]
+
+        def all(self, formula=None):
+            return self._recs
+
+    # A previous run created the meeting, the motion, and 2 of its votes.
+    meetings_table = SeededTable(
+        "Meetings", [{"id": "m_exist", "fields": {"Meeting ID": "M3"}}]
+    )
+    motions_table = SeededTable(
+        "Motions", [{"id": "mot_exist", "fields": {"Decision": title}}]
+    )
+    votes_table = SeededTable(
+        "Votes",
+        [
+            {"id": "v1", "fields": {"Motion": ["mot_exist"], "Councillor": ["c_kav"]}},
+            {"id": "v2", "fields": {"Motion": ["mot_exist"], "Councillor": ["c_king"]}},
+        ],
+    )
+    councillors_table = SeededTable(
+        "Councillors",
+        [
+            {"id": "c_kav", "fields": {"Councillor": "T. Kavanagh"}},
+            {"id": "c_king", "fields": {"Councillor": "R. King"}},
+        ],
+    )
+
+    class FakeApi:
+        def __init__(self, token):
+            self.token = token
+
+        def table(self, base, name):
+            return {
+                "Meetings": meetings_table,
+                "Motions": motions_table,
+                "Votes": votes_table,
+                scraper.COUNCILLORS_TABLE: councillors_table,
+            }[name]
+
+    monkeypatch.setattr(scraper, "Api", FakeApi)
+    scraper.AIRTABLE_TOKEN = "x"
+    scraper.BASE_ID = "b"
+    # reset councillor state left over from other tests
+    scraper.councillor_cache.clear()
+    monkeypatch.setattr(scraper, "_councillors_loaded", False)
+    monkeypatch.setattr(scraper, "_councillors_fetched", False)
+
+    meeting = {
+        "ID": "M3",
+        "MeetingName": "Test3",
+        "StartDate": "2025-10-03",
+        "Url": "http://x",
+    }
+    scraper.upload_to_airtable(meeting, motions)
+
+    # meeting and motion are reused, never re-created
+    assert len(meetings_table.created) == 0
+    assert len(motions_table.created) == 0
+    # only the votes missing from Airtable are backfilled, onto the
+    # existing motion record
+    expected_votes = (
+        len(motions[0]["for_names"]) + len(motions[0]["against_names"]) - 2
+    )
+    assert len(votes_table.created) == expected_votes
+    assert all(p["Motion"] == ["mot_exist"] for p in votes_table.created)
+    assert not any(
+        p["Councillor"] in (["c_kav"], ["c_king"]) for p in votes_table.created
+    )
+
+
 def test_upload_creates_meeting_when_missing(monkeypatch):
     html = Path("tests/fixtures/sample_minutes.html").read_text(encoding="utf-8")
     motions = scraper.parse_votes(html)